@@ -41,10 +41,14 @@ from pants.engine.target import (
     generate_multiple_sources_field_help_message,
 )
 from pants.engine.unions import UnionRule
-from pants.util.enums import match
 from pants.util.strutil import help_text
 
 
+_SHUNIT2_DEFAULT_GLOBS = ("*_test.sh", "test_*.sh", "tests.sh")
+# Test files belong to `shunit2_tests`, so `shell_sources` excludes them by default.
+_SHELL_SOURCES_DEFAULT_GLOBS = ("*.sh", *(f"!{glob}" for glob in _SHUNIT2_DEFAULT_GLOBS))
+
+
 class ShellDependenciesField(AdhocToolDependenciesField):
     pass
 
@@ -78,6 +82,9 @@ def generator_settings(
 # -----------------------------------------------------------------------------------------------
 
 
+_SHEBANG_RE = re.compile(rb"^#! *[/\w]*/(?P<program>\w+) *(?P<arg>\w*)")
+
+
 class Shunit2Shell(Enum):
     sh = "sh"
     bash = "bash"
@@ -86,38 +93,36 @@ class Shunit2Shell(Enum):
     pdksh = "pdksh"
     zsh = "zsh"
 
-    @classmethod
-    def parse_shebang(cls, shebang: bytes) -> Shunit2Shell | None:
+    @staticmethod
+    def parse_shebang(shebang: bytes) -> Shunit2Shell | None:
         if not shebang:
             return None
-        first_line = shebang.splitlines()[0]
-        matches = re.match(rb"^#! *[/\w]*/(?P<program>\w+) *(?P<arg>\w*)", first_line)
+        first_line = shebang.split(b"\n", 1)[0]
+        matches = _SHEBANG_RE.match(first_line)
         if not matches:
             return None
         program = matches.group("program")
         if program == b"env":
             program = matches.group("arg")
-        try:
-            return cls(program.decode())
-        except ValueError:
-            return None
+        return _SHUNIT2_SHELLS_BY_PROGRAM.get(program)
 
     @property
     def binary_path_test(self) -> BinaryPathTest | None:
-        arg = match(  # type: ignore[misc]
-            self,
-            {
-                self.sh: None,
-                self.bash: "--version",
-                self.dash: None,
-                self.ksh: "--version",
-                self.pdksh: None,
-                self.zsh: "--version",
-            },
-        )
-        if not arg:
-            return None
-        return BinaryPathTest((arg,))
+        return _SHUNIT2_BINARY_PATH_TESTS[self]
+
+
+_SHUNIT2_SHELLS_BY_PROGRAM = {shell.value.encode(): shell for shell in Shunit2Shell}
+_SHUNIT2_VERSION_ARGS: dict[Shunit2Shell, str | None] = {
+    Shunit2Shell.sh: None,
+    Shunit2Shell.bash: "--version",
+    Shunit2Shell.dash: None,
+    Shunit2Shell.ksh: "--version",
+    Shunit2Shell.pdksh: None,
+    Shunit2Shell.zsh: "--version",
+}
+_SHUNIT2_BINARY_PATH_TESTS: dict[Shunit2Shell, BinaryPathTest | None] = {
+    shell: BinaryPathTest((arg,)) if arg else None for shell, arg in _SHUNIT2_VERSION_ARGS.items()
+}
 
 
 class Shunit2TestDependenciesField(ShellDependenciesField):
@@ -177,7 +182,7 @@ class Shunit2TestTarget(Target):
 
 
 class Shunit2TestsGeneratorSourcesField(ShellGeneratingSourcesBase):
-    default = ("*_test.sh", "test_*.sh", "tests.sh")
+    default = _SHUNIT2_DEFAULT_GLOBS
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['test.sh', 'test_*.sh', '!test_ignore.sh']`"
     )
@@ -227,7 +232,7 @@ class ShellSourceTarget(Target):
 
 
 class ShellSourcesGeneratingSourcesField(ShellGeneratingSourcesBase):
-    default = ("*.sh",) + tuple(f"!{pat}" for pat in Shunit2TestsGeneratorSourcesField.default)
+    default = _SHELL_SOURCES_DEFAULT_GLOBS
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['example.sh', 'new_*.sh', '!old_ignore.sh']`"
     )
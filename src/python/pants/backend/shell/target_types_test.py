@@ -6,6 +6,7 @@ from __future__ import annotations
 import pytest
 
 from pants.backend.shell.target_types import Shunit2Shell
+from pants.core.util_rules.system_binaries import BinaryPathTest
 
 
 @pytest.mark.parametrize(
@@ -31,6 +32,8 @@ from pants.backend.shell.target_types import Shunit2Shell
         (b"#!/path/to/env sh ", Shunit2Shell.sh),
         (b"#!/path/to/sh arg1 arg2 ", Shunit2Shell.sh),
         (b"#!/path/to/env sh\n", Shunit2Shell.sh),
+        (b"#!/path/to/env sh\r\n", Shunit2Shell.sh),
+        (b"#!/path/to/sh/", Shunit2Shell.sh),
         # Must be absolute path.
         (b"#!/sh", Shunit2Shell.sh),
         (b"#!sh", None),
@@ -40,6 +43,8 @@ from pants.backend.shell.target_types import Shunit2Shell
         (b"something #!/path/to/sh", None),
         (b"something #!/path/to/env sh", None),
         (b"\n#!/path/to/sh", None),
+        (b"#!/path/to/env", None),
+        (b"#!/path/to/ sh", None),
     ],
 )
 def test_shunit2_shell_parse_shebang(content: bytes, expected: Shunit2Shell | None) -> None:
@@ -48,3 +53,25 @@ def test_shunit2_shell_parse_shebang(content: bytes, expected: Shunit2Shell | No
         assert result is None
     else:
         assert result == expected
+
+
+@pytest.mark.parametrize(
+    ["shell", "expected"],
+    [
+        (Shunit2Shell.sh, None),
+        (Shunit2Shell.bash, BinaryPathTest(("--version",))),
+        (Shunit2Shell.dash, None),
+        (Shunit2Shell.ksh, BinaryPathTest(("--version",))),
+        (Shunit2Shell.pdksh, None),
+        (Shunit2Shell.zsh, BinaryPathTest(("--version",))),
+    ],
+)
+def test_shunit2_shell_binary_path_test(
+    shell: Shunit2Shell, expected: BinaryPathTest | None
+) -> None:
+    assert shell.binary_path_test == expected
+
+
+@pytest.mark.parametrize("shell", list(Shunit2Shell))
+def test_shunit2_shell_binary_path_test_is_shared(shell: Shunit2Shell) -> None:
+    assert shell.binary_path_test is shell.binary_path_test